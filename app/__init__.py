@@ -1,7 +1,7 @@
 """
 App package initialization.
 """
-from app.config import Config
+from app.config import Config, get_config
 
 __version__ = "1.0.0"
-__all__ = ["Config"]
+__all__ = ["Config", "get_config"]
@@ -2,49 +2,75 @@
 Application configuration settings.
 """
 import os
+import copy
 import json
+import functools
 import logging
 from pathlib import Path
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # optional dependency
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 
+# (config class, filepath) -> (st_mtime_ns, st_size, loaded config)
+_CONFIG_CACHE: dict = {}
+
 
 class Config:
     """Base configuration class."""
 
     APP_NAME = "SampleApp"
-    DEBUG = os.getenv("DEBUG", "false").lower() == "true"
-    SECRET_KEY = os.getenv("SECRET_KEY", "default-secret-key-change-in-production")
+    LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
-    DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///sample.db")
-    REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+    @classmethod
+    def _load(cls) -> None:
+        """Populate environment-driven settings from a single os.environ snapshot."""
+        env = os.environ.copy()
+        cls.DEBUG = env.get("DEBUG", "false").lower() == "true"
+        cls.SECRET_KEY = env.get("SECRET_KEY", "default-secret-key-change-in-production")
 
-    EMAIL_HOST = os.getenv("EMAIL_HOST", "smtp.gmail.com")
-    EMAIL_PORT = int(os.getenv("EMAIL_PORT", "587"))
-    EMAIL_USERNAME = os.getenv("EMAIL_USERNAME", "")
-    EMAIL_PASSWORD = os.getenv("EMAIL_PASSWORD", "")
+        cls.DATABASE_URL = env.get("DATABASE_URL", "sqlite:///sample.db")
+        cls.REDIS_URL = env.get("REDIS_URL", "redis://localhost:6379/0")
 
-    PAYMENT_API_KEY = os.getenv("PAYMENT_API_KEY", "")
-    PAYMENT_GATEWAY_URL = os.getenv("PAYMENT_GATEWAY_URL", "https://api.payment.example.com")
+        cls.EMAIL_HOST = env.get("EMAIL_HOST", "smtp.gmail.com")
+        cls.EMAIL_PORT = int(env.get("EMAIL_PORT", "587"))
+        cls.EMAIL_USERNAME = env.get("EMAIL_USERNAME", "")
+        cls.EMAIL_PASSWORD = env.get("EMAIL_PASSWORD", "")
 
-    LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
-    LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+        cls.PAYMENT_API_KEY = env.get("PAYMENT_API_KEY", "")
+        cls.PAYMENT_GATEWAY_URL = env.get("PAYMENT_GATEWAY_URL", "https://api.payment.example.com")
+
+        cls.LOG_LEVEL = env.get("LOG_LEVEL", "INFO")
 
     @classmethod
     def from_json(cls, filepath: str) -> "Config":
-        """Load config overrides from a JSON file."""
-        config = cls()
+        """
+        Load config overrides from a JSON file.
+        The parsed file is cached until its mtime or size changes; every call
+        returns a fresh copy, so callers may modify the result freely.
+        """
         try:
-            with open(filepath, "r") as f:
-                data = json.load(f)
+            st = os.stat(filepath)
+            cached = _CONFIG_CACHE.get((cls, filepath))
+            if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+                return copy.deepcopy(cached[2])
+            config = cls()
+            with open(filepath, "rb") as f:
+                data = _json_loads(f.read())
             for key, value in data.items():
                 if hasattr(config, key):
                     setattr(config, key, value)
         except FileNotFoundError:
             logger.warning(f"Config file not found: {filepath}")
-        return config
+            return cls()
+        _CONFIG_CACHE[(cls, filepath)] = (st.st_mtime_ns, st.st_size, config)
+        return copy.deepcopy(config)
 
     def to_dict(self) -> dict:
         """Export config as dictionary (excludes secrets)."""
@@ -54,3 +80,12 @@ class Config:
             "DATABASE_URL": self.DATABASE_URL,
             "LOG_LEVEL": self.LOG_LEVEL,
         }
+
+
+Config._load()
+
+
+@functools.lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Return the shared Config instance, creating it on first use."""
+    return Config()
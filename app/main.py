@@ -104,9 +104,9 @@ def demo_data_pipeline(config: Config) -> None:
     processor = DataProcessor()
     result = (
         processor
-        .add_step(lambda r: DataProcessor.drop_missing(r, ["name", "price"]))
-        .add_step(lambda r: DataProcessor.normalize_strings(r, ["name", "category"]))
-        .add_step(lambda r: DataProcessor.cast_numeric(r, ["price"]))
+        .add_step(DataProcessor.drop_missing_step(["name", "price"]))
+        .add_step(DataProcessor.normalize_strings_step(["name", "category"]))
+        .add_step(DataProcessor.cast_numeric_step(["price"]))
         .run(raw_data)
     )
 
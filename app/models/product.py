@@ -2,6 +2,7 @@
 Product model definition.
 """
 from datetime import datetime
+from operator import attrgetter
 from typing import Optional, List
 from dataclasses import dataclass, field
 from enum import Enum
@@ -17,7 +18,7 @@ class ProductCategory(Enum):
     OTHER = "other"
 
 
-@dataclass
+@dataclass(slots=True)
 class ProductVariant:
     """Represents a size/color variant of a product."""
     sku: str
@@ -27,7 +28,10 @@ class ProductVariant:
     price_modifier: float = 0.0
 
 
-@dataclass
+_get_stock = attrgetter("stock")
+
+
+@dataclass(slots=True)
 class Product:
     """Represents a store product."""
     name: str
@@ -42,7 +46,7 @@ class Product:
 
     def __post_init__(self):
         if self.product_id is None:
-            self.product_id = generate_sku(self.name, self.category.value)
+            self.product_id = generate_sku(self.name, self.category._value_)
 
     @property
     def formatted_price(self) -> str:
@@ -53,7 +57,7 @@ class Product:
         """Sum of stock across all variants, or -1 if no variants (unlimited)."""
         if not self.variants:
             return -1  # unlimited
-        return sum(v.stock for v in self.variants)
+        return sum(map(_get_stock, self.variants))
 
     def add_variant(self, variant: ProductVariant) -> None:
         self.variants.append(variant)
@@ -76,7 +80,7 @@ class Product:
             "name": self.name,
             "price": self.base_price,
             "formatted_price": self.formatted_price,
-            "category": self.category.value,
+            "category": self.category._value_,
             "total_stock": self.total_stock,
             "is_available": self.is_available,
         }
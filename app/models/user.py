@@ -2,6 +2,7 @@
 User model definition.
 """
 import hashlib
+import hmac
 import secrets
 from datetime import datetime
 from typing import Optional, List
@@ -9,8 +10,10 @@ from dataclasses import dataclass, field
 
 from app.utils.validators import validate_email, validate_password
 
+SALT_SIZE = 16
 
-@dataclass
+
+@dataclass(slots=True)
 class Address:
     """Represents a physical address."""
     street: str
@@ -23,12 +26,12 @@ class Address:
         return f"{self.street}, {self.city}, {self.state} {self.zip_code}, {self.country}"
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     """Represents an application user."""
     username: str
     email: str
-    _password_hash: str = field(default="", repr=False)
+    _password_hash: bytes = field(default=b"", repr=False)
     first_name: str = ""
     last_name: str = ""
     is_active: bool = True
@@ -49,16 +52,19 @@ class User:
         """Hash and store a password."""
         if not validate_password(raw_password):
             raise ValueError("Password does not meet requirements.")
-        salt = secrets.token_hex(16)
-        hashed = hashlib.sha256(f"{salt}{raw_password}".encode()).hexdigest()
-        self._password_hash = f"{salt}:{hashed}"
+        salt = secrets.token_bytes(SALT_SIZE)
+        h = hashlib.sha256(salt)
+        h.update(raw_password.encode())
+        self._password_hash = salt + h.digest()
 
     def check_password(self, raw_password: str) -> bool:
         """Verify a raw password against the stored hash."""
         if not self._password_hash:
             return False
-        salt, hashed = self._password_hash.split(":", 1)
-        return hashlib.sha256(f"{salt}{raw_password}".encode()).hexdigest() == hashed
+        salt, hashed = self._password_hash[:SALT_SIZE], self._password_hash[SALT_SIZE:]
+        h = hashlib.sha256(salt)
+        h.update(raw_password.encode())
+        return hmac.compare_digest(h.digest(), hashed)
 
     def add_address(self, address: Address) -> None:
         self.addresses.append(address)
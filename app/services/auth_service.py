@@ -3,7 +3,9 @@ Authentication service.
 """
 import logging
 import secrets
-from datetime import datetime, timedelta
+import time
+from collections import OrderedDict
+from datetime import datetime
 from typing import Optional, Dict
 
 from app.models.user import User
@@ -22,11 +24,13 @@ class AuthService:
     """Handles user authentication and token management."""
 
     TOKEN_EXPIRY_HOURS = 24
+    TOKEN_SWEEP_THRESHOLD = 1024
 
     def __init__(self, config: Config):
         self.config = config
         self._users: Dict[str, User] = {}       # username -> User
-        self._tokens: Dict[str, dict] = {}       # token -> {username, expires_at}
+        # token -> {username, expires_at (monotonic)}; insertion order == expiry order
+        self._tokens: "OrderedDict[str, dict]" = OrderedDict()
 
     def register(self, username: str, email: str, password: str, **kwargs) -> User:
         """Register a new user."""
@@ -49,8 +53,10 @@ class AuthService:
         token = self._generate_token()
         self._tokens[token] = {
             "username": username,
-            "expires_at": datetime.utcnow() + timedelta(hours=self.TOKEN_EXPIRY_HOURS),
+            "expires_at": time.monotonic() + self.TOKEN_EXPIRY_HOURS * 3600,
         }
+        if len(self._tokens) > self.TOKEN_SWEEP_THRESHOLD:
+            self._purge_expired_tokens()
         user.last_login = datetime.utcnow()
         logger.info(f"User '{username}' logged in.")
         return token
@@ -66,11 +72,17 @@ class AuthService:
         token_data = self._tokens.get(token)
         if not token_data:
             return None
-        if datetime.utcnow() > token_data["expires_at"]:
+        if time.monotonic() > token_data["expires_at"]:
             self._tokens.pop(token)
             return None
         return self._users.get(token_data["username"])
 
+    def _purge_expired_tokens(self) -> None:
+        """Evict expired tokens; all tokens share one TTL, so the oldest expire first."""
+        now = time.monotonic()
+        while self._tokens and next(iter(self._tokens.values()))["expires_at"] < now:
+            self._tokens.popitem(last=False)
+
     def _generate_token(self) -> str:
         return secrets.token_urlsafe(32)
 
@@ -1,38 +1,38 @@
 """
 Email notification service.
 """
+import atexit
 import logging
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from typing import List, Optional
-from string import Template
+from typing import TYPE_CHECKING, List, Optional
 
 from app.config import Config
 from app.utils.helpers import format_currency
 
+if TYPE_CHECKING:
+    import smtplib
+
 logger = logging.getLogger(__name__)
 
-WELCOME_TEMPLATE = Template("""
-Hello $name,
+WELCOME_TEMPLATE = """
+Hello {name},
 
-Welcome to $app_name! Your account has been created successfully.
+Welcome to {app_name}! Your account has been created successfully.
 
-Username: $username
+Username: {username}
 
 Thanks for joining us!
-""")
+"""
 
-ORDER_TEMPLATE = Template("""
-Hello $name,
+ORDER_TEMPLATE = """
+Hello {name},
 
 Your order has been confirmed.
 
-Order ID : $order_id
-Total     : $total
+Order ID : {order_id}
+Total     : {total}
 
 We'll notify you when it ships.
-""")
+"""
 
 
 class EmailService:
@@ -41,35 +41,30 @@ class EmailService:
     def __init__(self, config: Config):
         self.config = config
         self._sent: List[dict] = []  # in-memory log for testing
+        self._smtp: Optional["smtplib.SMTP"] = None  # reused across sends
 
     def send_welcome_email(self, to_email: str, username: str, name: str) -> bool:
         """Send a welcome email to a newly registered user."""
-        body = WELCOME_TEMPLATE.substitute(
-            name=name or username,
-            app_name=self.config.APP_NAME,
-            username=username,
-        )
+        body = WELCOME_TEMPLATE.format_map({
+            "name": name or username,
+            "app_name": self.config.APP_NAME,
+            "username": username,
+        })
         return self._send(to_email, subject=f"Welcome to {self.config.APP_NAME}!", body=body)
 
     def send_order_confirmation(
         self, to_email: str, name: str, order_id: str, total: float
     ) -> bool:
         """Send an order confirmation email."""
-        body = ORDER_TEMPLATE.substitute(
-            name=name,
-            order_id=order_id,
-            total=format_currency(total),
-        )
+        body = ORDER_TEMPLATE.format_map({
+            "name": name,
+            "order_id": order_id,
+            "total": format_currency(total),
+        })
         return self._send(to_email, subject=f"Order Confirmation - {order_id}", body=body)
 
     def _send(self, to: str, subject: str, body: str) -> bool:
         """Internal method to send an email via SMTP."""
-        msg = MIMEMultipart()
-        msg["From"] = self.config.EMAIL_USERNAME
-        msg["To"] = to
-        msg["Subject"] = subject
-        msg.attach(MIMEText(body, "plain"))
-
         # Log for testing / dev mode
         self._sent.append({"to": to, "subject": subject})
 
@@ -77,17 +72,63 @@ class EmailService:
             logger.debug(f"[DEBUG] Skipping SMTP. Email to {to}: {subject}")
             return True
 
+        # Imported lazily: debug/test runs never reach the SMTP path.
+        import smtplib
+        from email.mime.text import MIMEText
+        from email.mime.multipart import MIMEMultipart
+
+        msg = MIMEMultipart()
+        msg["From"] = self.config.EMAIL_USERNAME
+        msg["To"] = to
+        msg["Subject"] = subject
+        msg.attach(MIMEText(body, "plain"))
+
         try:
-            with smtplib.SMTP(self.config.EMAIL_HOST, self.config.EMAIL_PORT) as server:
-                server.starttls()
-                server.login(self.config.EMAIL_USERNAME, self.config.EMAIL_PASSWORD)
-                server.send_message(msg)
+            try:
+                self._connection().send_message(msg)
+            except smtplib.SMTPServerDisconnected:
+                # The server dropped the connection (an idle one, or while connecting);
+                # reconnect once and retry.
+                if self._smtp is not None:
+                    self._smtp.close()
+                    self._smtp = None
+                self._connection().send_message(msg)
             logger.info(f"Email sent to {to}: {subject}")
             return True
         except smtplib.SMTPException as e:
             logger.error(f"Failed to send email to {to}: {e}")
             return False
 
+    def _connection(self) -> "smtplib.SMTP":
+        """Return the open SMTP connection, connecting and logging in on first use."""
+        if self._smtp is None:
+            import smtplib
+
+            server = smtplib.SMTP(self.config.EMAIL_HOST, self.config.EMAIL_PORT)
+            try:
+                server.starttls()
+                server.login(self.config.EMAIL_USERNAME, self.config.EMAIL_PASSWORD)
+            except smtplib.SMTPException:
+                server.close()
+                raise
+            self._smtp = server
+            atexit.unregister(self.close)
+            atexit.register(self.close)
+        return self._smtp
+
+    def close(self) -> None:
+        """Close the persistent SMTP connection, if one is open."""
+        if self._smtp is None:
+            return
+        import smtplib
+
+        try:
+            self._smtp.quit()
+        except smtplib.SMTPException:
+            self._smtp.close()
+        self._smtp = None
+        atexit.unregister(self.close)
+
     @property
     def sent_count(self) -> int:
         return len(self._sent)
@@ -1,7 +1,6 @@
 """
 Payment processing service.
 """
-import uuid
 import logging
 from datetime import datetime
 from typing import Optional, Dict
@@ -38,7 +37,9 @@ class PaymentService:
         if not validate_card_number(card_number):
             raise ValueError("Invalid card number.")
 
-        transaction_id = str(uuid.uuid4())
+        import uuid  # deferred: only needed once a charge is actually made
+
+        transaction_id = uuid.uuid4().hex
         masked_card = f"****-****-****-{card_number[-4:]}"
 
         # Simulate gateway call (always succeeds in dev mode)
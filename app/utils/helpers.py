@@ -1,35 +1,46 @@
 """
 General helper utilities.
 """
-import uuid
 import math
+import functools
 import hashlib
+import itertools
 import logging
-from typing import TypeVar, List, Tuple, Any
+from typing import TypeVar, List, Tuple, Any, Iterable, Iterator, Collection, Sequence
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+CURRENCY_SYMBOLS = {"USD": "$", "EUR": "€", "GBP": "£", "INR": "₹"}
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_currency(amount: float, sign: float, currency: str) -> str:
+    symbol = CURRENCY_SYMBOLS.get(currency.upper(), currency)
+    return f"{symbol}{amount:,.2f}"
+
 
 def format_currency(amount: float, currency: str = "USD") -> str:
     """Format a float as a currency string."""
-    symbols = {"USD": "$", "EUR": "€", "GBP": "£", "INR": "₹"}
-    symbol = symbols.get(currency.upper(), currency)
-    return f"{symbol}{amount:,.2f}"
+    # 0.0 and -0.0 are equal cache keys but format differently, so key on the sign too.
+    return _format_currency(amount, math.copysign(1.0, amount), currency)
 
 
 def generate_sku(name: str, category: str) -> str:
     """Generate a short unique SKU based on product name and category."""
     seed = f"{name.upper()}-{category.upper()}"
-    digest = hashlib.md5(seed.encode()).hexdigest()[:6].upper()
+    digest = hashlib.blake2b(seed.encode(), digest_size=3).hexdigest().upper()
     return f"{category[:3].upper()}-{digest}"
 
 
-def paginate(items: List[T], page: int, page_size: int) -> Tuple[List[T], int]:
+def paginate(items: Collection[T], page: int, page_size: int) -> Tuple[List[T], int]:
     """
     Paginate a list.
     Returns (page_items, total_pages).
+
+    Sequences are sliced directly; other sized collections (sets, dict views,
+    deques) are read up to the end of the requested page only.
     """
     if page_size <= 0:
         raise ValueError("page_size must be positive.")
@@ -37,26 +48,38 @@ def paginate(items: List[T], page: int, page_size: int) -> Tuple[List[T], int]:
     page = max(1, min(page, total_pages))
     start = (page - 1) * page_size
     end = start + page_size
-    return items[start:end], total_pages
+    if isinstance(items, Sequence):
+        return items[start:end], total_pages
+    return list(itertools.islice(items, start, end)), total_pages
 
 
-def chunk_list(items: List[Any], size: int) -> List[List[Any]]:
-    """Split a list into chunks of a given size."""
-    return [items[i : i + size] for i in range(0, len(items), size)]
+def chunk_list(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """
+    Lazily split an iterable into chunks of a given size.
+    Yields lists of up to `size` items; the input is consumed as chunks are requested.
+    """
+    if size <= 0:
+        raise ValueError("size must be positive.")
+    it = iter(items)
+    return iter(lambda: list(itertools.islice(it, size)), [])
 
 
 def deep_merge(base: dict, override: dict) -> dict:
-    """Recursively merge two dictionaries; override takes precedence."""
-    result = base.copy()
+    """
+    Recursively merge two dictionaries; override takes precedence.
+    Only nested dicts present in both inputs are copied; other values are shared.
+    """
+    result = {**base, **override}
     for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = deep_merge(result[key], value)
-        else:
-            result[key] = value
+        if isinstance(value, dict):
+            base_value = base.get(key)
+            if isinstance(base_value, dict):
+                result[key] = deep_merge(base_value, value)
     return result
 
 
 def generate_id(prefix: str = "") -> str:
     """Generate a prefixed UUID string."""
-    uid = str(uuid.uuid4()).replace("-", "")
+    import uuid  # deferred: only needed once an id is actually generated
+    uid = uuid.uuid4().hex
     return f"{prefix}{uid}" if prefix else uid
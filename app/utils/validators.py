@@ -5,15 +5,28 @@ import re
 from typing import Optional
 
 
-EMAIL_REGEX = re.compile(r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$")
+EMAIL_REGEX = re.compile(rb"^\s*[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+\s*$")
 PASSWORD_MIN_LENGTH = 8
 
+PASSWORD_REGEX = re.compile(
+    rf"(?=.*[A-Z])(?=.*[a-z])(?=.*\d).{{{PASSWORD_MIN_LENGTH},}}", re.DOTALL
+)
+
+_NON_DIGITS = bytes(i for i in range(256) if not 48 <= i <= 57)
+
+# Luhn contribution of each ASCII digit byte, at undoubled and doubled positions.
+_LUHN_SINGLE = bytes(i - 48 if 48 <= i <= 57 else 0 for i in range(256))
+_LUHN_DOUBLE = bytes(
+    (2 * (i - 48) - 9 if i >= 53 else 2 * (i - 48)) if 48 <= i <= 57 else 0
+    for i in range(256)
+)
+
 
 def validate_email(email: str) -> bool:
     """Return True if the email address has a valid format."""
-    if not email or not isinstance(email, str):
+    if not email or not isinstance(email, str) or not email.isascii():
         return False
-    return bool(EMAIL_REGEX.match(email.strip()))
+    return bool(EMAIL_REGEX.match(email.encode("ascii")))
 
 
 def validate_password(password: str) -> bool:
@@ -23,31 +36,19 @@ def validate_password(password: str) -> bool:
     - Contain at least one digit
     - Contain at least one uppercase and one lowercase letter
     """
-    if len(password) < PASSWORD_MIN_LENGTH:
-        return False
-    if not re.search(r"[A-Z]", password):
-        return False
-    if not re.search(r"[a-z]", password):
-        return False
-    if not re.search(r"\d", password):
-        return False
-    return True
+    return bool(PASSWORD_REGEX.fullmatch(password))
 
 
 def validate_card_number(number: str) -> bool:
     """Validate a credit card number using the Luhn algorithm."""
-    digits = re.sub(r"\D", "", number)
+    digits = number.encode("ascii", "ignore").translate(None, _NON_DIGITS)
     if len(digits) < 13 or len(digits) > 19:
         return False
-    total = 0
     reverse_digits = digits[::-1]
-    for i, digit in enumerate(reverse_digits):
-        n = int(digit)
-        if i % 2 == 1:
-            n *= 2
-            if n > 9:
-                n -= 9
-        total += n
+    total = (
+        sum(reverse_digits[::2].translate(_LUHN_SINGLE))
+        + sum(reverse_digits[1::2].translate(_LUHN_DOUBLE))
+    )
     return total % 10 == 0
 
 
@@ -2,6 +2,6 @@
 Data package.
 """
 from data.loader import DataLoader
-from data.processor import DataProcessor
+from data.processor import DataProcessor, RowStep
 
-__all__ = ["DataLoader", "DataProcessor"]
+__all__ = ["DataLoader", "DataProcessor", "RowStep"]
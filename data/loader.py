@@ -2,63 +2,183 @@
 Data loading utilities — reads CSV, JSON, or plain text sources.
 """
 import csv
+import errno
+import functools
 import json
 import logging
+import mmap
+import os
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import TYPE_CHECKING, List, Dict, Any, Iterator, Optional
 
 from app.config import Config
 from app.utils.helpers import chunk_list
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # optional dependency
+    _json_loads = json.loads
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
 logger = logging.getLogger(__name__)
 
+DIRECT_IO_CHUNK_SIZE = 16 * 1024 * 1024
+
+
+def _read_buffered(filepath: str) -> bytes:
+    with open(filepath, "rb") as f:
+        return f.read()
+
+
+def _read_file_bytes(filepath: str, direct_io: bool = False) -> bytes:
+    """
+    Read a whole file into memory.
+    With `direct_io`, reads with O_DIRECT in large page-aligned chunks,
+    falling back to a buffered read where the filesystem rejects it (EINVAL).
+    """
+    if not (direct_io and hasattr(os, "O_DIRECT")):
+        return _read_buffered(filepath)
+    try:
+        fd = os.open(filepath, os.O_RDONLY | os.O_DIRECT)
+    except OSError as e:
+        if e.errno != errno.EINVAL:
+            raise
+        return _read_buffered(filepath)
+    try:
+        size = os.fstat(fd).st_size
+        pages = -(-max(size, 1) // mmap.PAGESIZE)
+        chunk = min(DIRECT_IO_CHUNK_SIZE, pages * mmap.PAGESIZE)
+        out = bytearray()
+        # Anonymous maps are page-aligned, which O_DIRECT requires of the buffer.
+        with mmap.mmap(-1, chunk) as buf, memoryview(buf) as view:
+            while True:
+                n = os.readv(fd, [view])
+                out += view[:n]
+                if n < chunk:
+                    break
+        return bytes(out)
+    except OSError as e:
+        if e.errno != errno.EINVAL:
+            raise
+        return _read_buffered(filepath)
+    finally:
+        os.close(fd)
+
+
+@functools.lru_cache(maxsize=64)
+def _load_json_cached(path: str, mtime_ns: int, size: int, direct_io: bool) -> Any:
+    # mtime/size are part of the cache key so that edited files are re-parsed.
+    return _json_loads(_read_file_bytes(path, direct_io))
+
 
 class DataLoader:
     """Load datasets from various file formats."""
 
-    def __init__(self, config: Config, base_dir: Optional[Path] = None):
+    def __init__(self, config: Config, base_dir: Optional[Path] = None, direct_io: bool = False):
         self.config = config
         self.base_dir = base_dir or Path(__file__).resolve().parent
+        # Bypass the page cache for whole-file reads (Linux O_DIRECT); helps cold, large loads.
+        self.direct_io = direct_io
 
-    def load_csv(self, filename: str, delimiter: str = ",") -> List[Dict[str, str]]:
-        """Load a CSV file and return a list of row dictionaries."""
-        filepath = self.base_dir / filename
-        rows = []
+    @property
+    def base_dir(self) -> Path:
+        return self._base_dir
+
+    @base_dir.setter
+    def base_dir(self, value: Path) -> None:
+        self._base_dir = Path(value)
+        # Plain-string form used to build file paths without pathlib overhead.
+        self._base = os.fspath(self._base_dir)
+
+    def _path(self, filename: str) -> str:
+        return os.path.join(self._base, filename)
+
+    def _read_bytes(self, filepath: str) -> bytes:
+        return _read_file_bytes(filepath, self.direct_io)
+
+    def iter_csv(self, filename: str, delimiter: str = ",") -> Iterator[Dict[str, str]]:
+        """Lazily yield row dictionaries from a CSV file, one at a time."""
+        filepath = self._path(filename)
         try:
             with open(filepath, newline="", encoding="utf-8") as f:
-                reader = csv.DictReader(f, delimiter=delimiter)
-                for row in reader:
-                    rows.append(dict(row))
-            logger.info(f"Loaded {len(rows)} rows from {filepath}")
+                yield from csv.DictReader(f, delimiter=delimiter)
         except FileNotFoundError:
-            logger.error(f"File not found: {filepath}")
+            logger.error("File not found: %s", filepath)
+
+    def load_csv(self, filename: str, delimiter: str = ",") -> List[Dict[str, str]]:
+        """
+        Load a CSV file and return a list of row dictionaries.
+        Reads the whole file eagerly; prefer `iter_csv` for large inputs.
+        """
+        rows = list(self.iter_csv(filename, delimiter))
+        if rows:
+            logger.info("Loaded %d rows from %s", len(rows), self._path(filename))
         return rows
 
-    def load_json(self, filename: str) -> Any:
-        """Load a JSON file and return the parsed object."""
-        filepath = self.base_dir / filename
+    def load_csv_arrow(
+        self,
+        filename: str,
+        delimiter: str = ",",
+        column_types: Optional[Dict[str, Any]] = None,
+    ) -> Optional["pa.Table"]:
+        """
+        Load a CSV file into a columnar pyarrow Table.
+        Passing `column_types` skips type inference for those columns.
+        Requires the optional `pyarrow` dependency, imported on first use.
+        """
         try:
-            with open(filepath, encoding="utf-8") as f:
-                data = json.load(f)
-            logger.info(f"Loaded JSON from {filepath}")
+            import pyarrow as pa
+            from pyarrow import csv as pa_csv
+        except ImportError:
+            raise ImportError("load_csv_arrow requires the 'pyarrow' package.") from None
+        filepath = self._path(filename)
+        try:
+            source = pa.BufferReader(self._read_bytes(filepath)) if self.direct_io else filepath
+            table = pa_csv.read_csv(
+                source,
+                parse_options=pa_csv.ParseOptions(delimiter=delimiter),
+                convert_options=pa_csv.ConvertOptions(column_types=column_types),
+            )
+            logger.info("Loaded %d rows from %s", table.num_rows, filepath)
+            return table
+        except FileNotFoundError:
+            logger.error("File not found: %s", filepath)
+            return None
+
+    def load_json(self, filename: str, cached: bool = False) -> Any:
+        """
+        Load a JSON file and return the parsed object.
+        With `cached=True`, the parsed object is memoized per (path, mtime, size) and
+        shared between callers, so it must be treated as read-only.
+        """
+        filepath = self._path(filename)
+        try:
+            if cached:
+                st = os.stat(filepath)
+                data = _load_json_cached(filepath, st.st_mtime_ns, st.st_size, self.direct_io)
+            else:
+                data = _json_loads(self._read_bytes(filepath))
+            logger.info("Loaded JSON from %s", filepath)
             return data
         except (FileNotFoundError, json.JSONDecodeError) as e:
-            logger.error(f"Failed to load JSON {filepath}: {e}")
+            logger.error("Failed to load JSON %s: %s", filepath, e)
             return None
 
     def load_text_lines(self, filename: str) -> List[str]:
         """Read a plain text file and return non-empty lines."""
-        filepath = self.base_dir / filename
+        filepath = self._path(filename)
         try:
             with open(filepath, encoding="utf-8") as f:
-                lines = [line.strip() for line in f if line.strip()]
-            logger.info(f"Loaded {len(lines)} lines from {filepath}")
+                lines = list(filter(None, map(str.strip, f)))
+            logger.info("Loaded %d lines from %s", len(lines), filepath)
             return lines
         except FileNotFoundError:
-            logger.error(f"File not found: {filepath}")
+            logger.error("File not found: %s", filepath)
             return []
 
-    def load_in_batches(self, filename: str, batch_size: int = 100) -> List[List[Dict]]:
-        """Load a CSV and return it split into batches."""
-        rows = self.load_csv(filename)
-        return chunk_list(rows, batch_size)
+    def load_in_batches(self, filename: str, batch_size: int = 100) -> Iterator[List[Dict]]:
+        """Stream a CSV in batches of up to `batch_size` rows without loading it all."""
+        return chunk_list(self.iter_csv(filename), batch_size)
@@ -0,0 +1,37 @@
+"""
+Tests for Config.
+"""
+import json
+import os
+
+from app.config import Config
+
+
+class TestConfig:
+
+    def test_from_json_applies_known_keys(self, tmp_path):
+        path = tmp_path / "config.json"
+        path.write_text(json.dumps({"LOG_LEVEL": "DEBUG", "UNKNOWN": 1}))
+        config = Config.from_json(str(path))
+        assert config.LOG_LEVEL == "DEBUG"
+        assert not hasattr(config, "UNKNOWN")
+
+    def test_from_json_missing_file(self, tmp_path):
+        config = Config.from_json(str(tmp_path / "missing.json"))
+        assert config.APP_NAME == "SampleApp"
+
+    def test_from_json_returns_independent_copies(self, tmp_path):
+        path = tmp_path / "config.json"
+        path.write_text(json.dumps({"LOG_LEVEL": "DEBUG"}))
+        first = Config.from_json(str(path))
+        first.LOG_LEVEL = "ERROR"
+        assert Config.from_json(str(path)).LOG_LEVEL == "DEBUG"
+
+    def test_from_json_reloads_when_size_changes(self, tmp_path):
+        path = tmp_path / "config.json"
+        path.write_text(json.dumps({"LOG_LEVEL": "DEBUG"}))
+        mtime = os.stat(path).st_mtime_ns
+        assert Config.from_json(str(path)).LOG_LEVEL == "DEBUG"
+        path.write_text(json.dumps({"LOG_LEVEL": "WARNING"}))
+        os.utime(path, ns=(mtime, mtime))
+        assert Config.from_json(str(path)).LOG_LEVEL == "WARNING"
@@ -0,0 +1,236 @@
+"""
+Tests for DataLoader and DataProcessor.
+"""
+import pytest
+
+from app.config import Config
+from data.loader import DataLoader
+from data import processor as processor_module
+from data.processor import DataProcessor, RowStep
+
+
+@pytest.fixture
+def loader(tmp_path):
+    return DataLoader(Config(), base_dir=tmp_path)
+
+
+# ------------------------------------------------------------------ #
+# DataLoader tests
+# ------------------------------------------------------------------ #
+
+class TestDataLoader:
+
+    def test_load_csv(self, loader, tmp_path):
+        (tmp_path / "rows.csv").write_text("name,price\nalice,12.5\nbob,3\n", encoding="utf-8")
+        assert loader.load_csv("rows.csv") == [
+            {"name": "alice", "price": "12.5"},
+            {"name": "bob", "price": "3"},
+        ]
+
+    def test_load_csv_missing_returns_empty(self, loader):
+        assert loader.load_csv("missing.csv") == []
+
+    def test_load_in_batches_streams(self, loader, tmp_path):
+        lines = ["id"] + [str(i) for i in range(5)]
+        (tmp_path / "ids.csv").write_text("\n".join(lines) + "\n", encoding="utf-8")
+        batches = loader.load_in_batches("ids.csv", batch_size=2)
+        assert len(next(batches)) == 2
+        assert [len(b) for b in batches] == [2, 1]
+
+    def test_load_text_lines_skips_blank(self, loader, tmp_path):
+        (tmp_path / "notes.txt").write_text("  first \n\n   \nsecond\r\n", encoding="utf-8")
+        assert loader.load_text_lines("notes.txt") == ["first", "second"]
+
+    def test_load_json(self, loader, tmp_path):
+        (tmp_path / "items.json").write_text('{"items": [1, 2, 3]}', encoding="utf-8")
+        assert loader.load_json("items.json") == {"items": [1, 2, 3]}
+
+    def test_load_json_cached_reloads_on_change(self, loader, tmp_path):
+        path = tmp_path / "ref.json"
+        path.write_text('{"v": 1}', encoding="utf-8")
+        first = loader.load_json("ref.json", cached=True)
+        assert loader.load_json("ref.json", cached=True) is first
+        path.write_text('{"v": 22}', encoding="utf-8")
+        assert loader.load_json("ref.json", cached=True) == {"v": 22}
+
+    def test_load_json_direct_io(self, tmp_path):
+        payload = '{"blob": "%s"}' % ("x" * 20000)
+        (tmp_path / "big.json").write_text(payload, encoding="utf-8")
+        loader = DataLoader(Config(), base_dir=tmp_path, direct_io=True)
+        assert loader.load_json("big.json") == {"blob": "x" * 20000}
+
+    def test_load_json_invalid_returns_none(self, loader, tmp_path):
+        (tmp_path / "broken.json").write_text("{not json", encoding="utf-8")
+        assert loader.load_json("broken.json") is None
+
+    def test_load_json_missing_returns_none(self, loader):
+        assert loader.load_json("missing.json") is None
+
+    def test_load_csv_arrow(self, loader, tmp_path):
+        pytest.importorskip("pyarrow")
+        (tmp_path / "rows.csv").write_text("name,price\nalice,12.5\nbob,3\n", encoding="utf-8")
+        table = loader.load_csv_arrow("rows.csv")
+        assert table.num_rows == 2
+        assert table.column("price").to_pylist() == [12.5, 3.0]
+
+
+# ------------------------------------------------------------------ #
+# DataProcessor tests
+# ------------------------------------------------------------------ #
+
+RAW_RECORDS = [
+    {"name": "  Alice ", "category": "FOOD", "price": "12.5"},
+    {"name": "bob", "category": "ELECTRONICS", "price": "499"},
+    {"name": "", "category": "BOOKS", "price": "9.99"},
+    {"name": "carol", "category": "clothing", "price": "bad"},
+]
+
+
+@pytest.fixture
+def records():
+    return [dict(r) for r in RAW_RECORDS]
+
+
+class TestDataProcessor:
+
+    def test_fused_row_steps_match_list_steps(self, records):
+        expected = DataProcessor.cast_numeric(
+            DataProcessor.normalize_strings(
+                DataProcessor.drop_missing([dict(r) for r in records], ["name", "price"]),
+                ["name", "category"],
+            ),
+            ["price"],
+        )
+        result = (
+            DataProcessor()
+            .add_step(DataProcessor.drop_missing_step(["name", "price"]))
+            .add_step(DataProcessor.normalize_strings_step(["name", "category"]))
+            .add_step(DataProcessor.cast_numeric_step(["price"]))
+            .run(records)
+        )
+        assert result == expected
+        assert [r["name"] for r in result] == ["alice", "bob"]
+
+    def test_row_steps_mix_with_list_steps(self, records):
+        result = (
+            DataProcessor()
+            .add_step(DataProcessor.drop_missing_step(["name"]))
+            .add_step(lambda rs: rs[:2])
+            .add_step(RowStep(lambda r: {**r, "seen": True}))
+            .run(records)
+        )
+        assert len(result) == 2
+        assert all(r["seen"] for r in result)
+
+    def test_drop_missing(self):
+        records = [{"a": 0}, {"a": ""}, {"a": []}, {"a": None}, {}, {"a": "x"}]
+        assert DataProcessor.drop_missing(records, ["a"]) == [{"a": 0}, {"a": "x"}]
+
+    def test_compiled_pipeline_matches_interpreted(self, records, caplog):
+        processor = (
+            DataProcessor()
+            .add_step(DataProcessor.drop_missing_step(["name", "price"]))
+            .add_step(lambda rs: rs[::-1])
+            .add_step(DataProcessor.normalize_strings_step(["name"]))
+            .add_step(DataProcessor.cast_numeric_step(["price"]))
+        )
+        compiled = processor.compile()([dict(r) for r in records])
+        with caplog.at_level("DEBUG", logger="data.processor"):
+            interpreted = processor.run([dict(r) for r in records])
+        assert compiled == interpreted
+        assert [r["name"] for r in compiled] == ["bob", "alice"]
+
+    def test_add_step_invalidates_compiled_pipeline(self):
+        processor = DataProcessor().add_step(lambda rs: rs + [{"n": 1}])
+        assert processor.compile()([]) == [{"n": 1}]
+        processor.add_step(lambda rs: rs * 2)
+        assert processor.run([]) == [{"n": 1}, {"n": 1}]
+
+    def test_parallel_run_matches_serial(self, records):
+        processor = (
+            DataProcessor()
+            .add_step(DataProcessor.drop_missing_step(["name", "price"]))
+            .add_step(DataProcessor.normalize_strings_step(["name", "category"]))
+            .add_step(DataProcessor.cast_numeric_step(["price"]))
+        )
+        processor.PARALLEL_MIN_RECORDS = 2
+        data = [dict(r) for r in records * 5]
+        expected = processor.run([dict(r) for r in data])
+        assert processor.run(data, workers=2) == expected
+
+    def test_parallel_run_falls_back_without_fork(self, records, monkeypatch):
+        monkeypatch.setattr(processor_module.sys, "platform", "darwin")
+        monkeypatch.setattr(
+            processor_module, "_apply_row_fns_parallel",
+            lambda *args: pytest.fail("forked a pool off Linux"),
+        )
+        processor = DataProcessor().add_step(DataProcessor.drop_missing_step(["name"]))
+        processor.PARALLEL_MIN_RECORDS = 2
+        assert len(processor.run([dict(r) for r in records], workers=2)) == 3
+
+    def test_row_step_called_directly(self, records):
+        step = DataProcessor.drop_missing_step(["name"])
+        assert len(step(records)) == 3
+
+    @pytest.fixture(params=["numpy", "stdlib"])
+    def stats_backend(self, request, monkeypatch):
+        if request.param == "numpy":
+            pytest.importorskip("numpy")
+        else:
+            monkeypatch.setattr(processor_module, "_import_numpy", lambda: None)
+        return request.param
+
+    def test_compute_stats(self, stats_backend):
+        stats = DataProcessor.compute_stats([{"v": 1.0}, {"v": 2.0}, {"v": 6.0}, {}], "v")
+        assert stats["count"] == 3
+        assert stats["mean"] == pytest.approx(3.0)
+        assert stats["median"] == pytest.approx(2.0)
+        assert stats["stdev"] == pytest.approx(2.6457513)
+        assert (stats["min"], stats["max"]) == (1.0, 6.0)
+
+    def test_compute_stats_int_values(self, stats_backend):
+        stats = DataProcessor.compute_stats([{"v": 1}, {"v": 2}, {"v": 6}], "v")
+        assert stats == {"count": 3, "mean": 3.0, "median": 2.0, "stdev": pytest.approx(2.6457513),
+                         "min": 1, "max": 6}
+        assert type(stats["min"]) is int and type(stats["mean"]) is float
+
+    def test_compute_stats_rejects_strings(self, stats_backend):
+        with pytest.raises(TypeError):
+            DataProcessor.compute_stats([{"v": "1"}, {"v": "2"}], "v")
+
+    def test_compute_stats_empty(self, stats_backend):
+        assert DataProcessor.compute_stats([{"other": 1}], "v") == {}
+
+    def test_group_by_preserves_first_seen_order(self, records):
+        groups = DataProcessor.group_by(records + [{"name": "dan", "category": "FOOD"}], "category")
+        assert list(groups) == ["FOOD", "ELECTRONICS", "BOOKS", "clothing"]
+        assert len(groups["FOOD"]) == 2
+
+    def test_group_by_df(self, records):
+        pytest.importorskip("pandas")
+        grouped = DataProcessor.group_by_df(records, "category")
+        assert grouped.size().to_dict() == {"FOOD": 1, "ELECTRONICS": 1, "BOOKS": 1, "clothing": 1}
+
+    def test_group_by_df_keeps_records_without_key(self):
+        pytest.importorskip("pandas")
+        records = [{"k": "a", "v": 1}, {"v": 2}, {"k": None, "v": 3}]
+        grouped = DataProcessor.group_by_df(records, "k")
+        assert grouped.size().sum() == 3
+        assert grouped.ngroups == 2
+
+    def test_group_by_df_without_key_column(self):
+        pytest.importorskip("pandas")
+        assert DataProcessor.group_by_df([], "k").ngroups == 0
+        grouped = DataProcessor.group_by_df([{"v": 1}, {"v": 2}], "k")
+        assert grouped.ngroups == 1
+        assert grouped.size().sum() == 2
+
+    def test_merge_defaults(self):
+        records = [{"a": 1}, {"b": 3, "opts": {"x": 9}}]
+        defaults = {"a": 0, "b": 2, "opts": {"x": 1, "y": 1}}
+        assert DataProcessor.merge_defaults(records, defaults) == [
+            {"a": 1, "b": 2, "opts": {"x": 1, "y": 1}},
+            {"a": 0, "b": 3, "opts": {"x": 9, "y": 1}},
+        ]
+        assert DataProcessor.merge_defaults(records, defaults, deep=False)[1]["opts"] == {"x": 9}
+        assert records == [{"a": 1}, {"b": 3, "opts": {"x": 9}}]
@@ -7,6 +7,7 @@ from datetime import datetime
 from app.models.user import User, Address
 from app.models.product import Product, ProductVariant, ProductCategory
 from app.utils.validators import validate_email, validate_password, validate_card_number
+from app.utils.helpers import format_currency
 
 
 # ------------------------------------------------------------------ #
@@ -69,6 +70,19 @@ class TestProductModel:
     def test_formatted_price(self):
         p = Product("Book", 14.99, ProductCategory.BOOKS)
         assert p.formatted_price == "$14.99"
+        p.base_price = 12.0
+        assert p.formatted_price == "$12.00"
+
+    def test_to_dict_tracks_category_change(self):
+        p = Product("Notebook", 4.5, ProductCategory.OTHER)
+        assert p.to_dict()["category"] == "other"
+        p.category = ProductCategory.BOOKS
+        assert p.to_dict()["category"] == "books"
+
+    def test_asdict_has_only_public_fields(self):
+        from dataclasses import asdict
+        p = Product("Notebook", 4.5, ProductCategory.OTHER)
+        assert not [key for key in asdict(p) if key.startswith("_")]
 
     def test_apply_discount(self):
         p = Product("Shirt", 50.0, ProductCategory.CLOTHING)
@@ -96,6 +110,24 @@ class TestProductModel:
         assert p.get_variant_by_sku("SH-BLK-42") is v
         assert p.get_variant_by_sku("MISSING") is None
 
+    def test_get_variant_by_sku_from_constructor(self):
+        v = ProductVariant("SH-WHT-41", color="White", size="41", stock=2)
+        p = Product("Shoes", 80.0, ProductCategory.CLOTHING, variants=[v])
+        assert p.get_variant_by_sku("SH-WHT-41") is v
+
+    def test_get_variant_by_sku_after_list_mutation(self):
+        v1 = ProductVariant("SH-RED-40", stock=1)
+        v2 = ProductVariant("SH-RED-41", stock=1)
+        p = Product("Shoes", 80.0, ProductCategory.CLOTHING)
+        p.variants.append(v1)
+        assert p.get_variant_by_sku("SH-RED-40") is v1
+        p.variants.remove(v1)
+        assert p.get_variant_by_sku("SH-RED-40") is None
+        p.variants = [v2]
+        assert p.get_variant_by_sku("SH-RED-41") is v2
+        p.variants = []
+        assert p.get_variant_by_sku("SH-RED-41") is None
+
 
 # ------------------------------------------------------------------ #
 # Validator tests
@@ -111,6 +143,7 @@ class TestValidators:
         assert validate_email("not-an-email") is False
         assert validate_email("") is False
         assert validate_email("@domain.com") is False
+        assert validate_email("us\u00e9r@example.com") is False
 
     def test_valid_passwords(self):
         assert validate_password("Secure1Pass") is True
@@ -124,7 +157,33 @@ class TestValidators:
     def test_luhn_valid_card(self):
         assert validate_card_number("4532015112830366") is True   # Visa test
         assert validate_card_number("5425233430109903") is True   # Mastercard test
+        assert validate_card_number("4532 0151 1283 0366") is True  # separators ignored
 
     def test_luhn_invalid_card(self):
         assert validate_card_number("1234567890123456") is False
         assert validate_card_number("0000") is False
+
+
+# ------------------------------------------------------------------ #
+# Helper tests
+# ------------------------------------------------------------------ #
+
+class TestHelpers:
+
+    def test_format_currency(self):
+        assert format_currency(1234.5) == "$1,234.50"
+        assert format_currency(10, "eur") == "€10.00"
+        assert format_currency(3, "CHF") == "CHF3.00"
+
+    def test_format_currency_rounding_matches_format_spec(self):
+        for amount in (0.005, 0.015, 0.025, 2.675, 1e16):
+            assert format_currency(amount) == f"${amount:,.2f}"
+
+    def test_format_currency_signed_zero(self):
+        assert format_currency(0.0) == "$0.00"
+        assert format_currency(-0.0) == "$-0.00"
+        assert format_currency(0.0) == "$0.00"
+
+    def test_format_currency_non_finite(self):
+        assert format_currency(float("nan")) == "$nan"
+        assert format_currency(float("inf")) == "$inf"
@@ -1,6 +1,8 @@
 """
 Tests for services — AuthService, EmailService, PaymentService.
 """
+import smtplib
+
 import pytest
 
 from app.config import Config
@@ -68,6 +70,15 @@ class TestAuthService:
         auth.logout(token)
         assert auth.get_user_from_token(token) is None
 
+    def test_login_sweeps_expired_tokens(self, auth):
+        auth.TOKEN_SWEEP_THRESHOLD = 1
+        auth.register("frank", "frank@example.com", "Password1")
+        old_token = auth.login("frank", "Password1")
+        auth._tokens[old_token]["expires_at"] = 0
+        new_token = auth.login("frank", "Password1")
+        assert old_token not in auth._tokens
+        assert auth.get_user_from_token(new_token).username == "frank"
+
     def test_duplicate_registration_raises(self, auth):
         auth.register("eve", "eve@example.com", "Password1")
         with pytest.raises(ValueError):
@@ -90,6 +101,118 @@ class TestEmailService:
         assert result is True
         assert email.sent_count == 1
 
+    def test_smtp_connection_reused(self, config, monkeypatch):
+        connections = []
+
+        class FakeSMTP:
+            def __init__(self, host, port):
+                self.sent = 0
+                connections.append(self)
+
+            def starttls(self):
+                pass
+
+            def login(self, username, password):
+                pass
+
+            def send_message(self, msg):
+                self.sent += 1
+
+            def quit(self):
+                pass
+
+        monkeypatch.setattr(smtplib, "SMTP", FakeSMTP)
+        config.DEBUG = False
+        service = EmailService(config)
+        service.send_welcome_email("test@example.com", "hank", "Hank")
+        service.send_order_confirmation("test@example.com", "Hank", "ORD-002", 10.0)
+        service.close()
+        assert len(connections) == 1
+        assert connections[0].sent == 2
+
+    def test_smtp_reconnects_after_disconnect(self, config, monkeypatch):
+        connections = []
+
+        class FakeSMTP:
+            def __init__(self, host, port):
+                self.sent = 0
+                self.closed = False
+                # The first connection goes stale after one message.
+                self.fail_after = 1 if not connections else None
+                connections.append(self)
+
+            def starttls(self):
+                pass
+
+            def login(self, username, password):
+                pass
+
+            def send_message(self, msg):
+                if self.fail_after is not None and self.sent >= self.fail_after:
+                    raise smtplib.SMTPServerDisconnected("idle timeout")
+                self.sent += 1
+
+            def quit(self):
+                pass
+
+            def close(self):
+                self.closed = True
+
+        monkeypatch.setattr(smtplib, "SMTP", FakeSMTP)
+        config.DEBUG = False
+        service = EmailService(config)
+        assert service.send_welcome_email("test@example.com", "ivy", "Ivy") is True
+        assert service.send_order_confirmation("test@example.com", "Ivy", "ORD-003", 5.0) is True
+        service.close()
+        assert len(connections) == 2
+        assert connections[0].closed is True
+        assert [c.sent for c in connections] == [1, 1]
+
+    def test_smtp_disconnect_while_connecting(self, config, monkeypatch):
+        connections = []
+
+        class FakeSMTP:
+            def __init__(self, host, port):
+                self.sent = 0
+                self.closed = False
+                connections.append(self)
+
+            def starttls(self):
+                # Only the first connection is dropped during STARTTLS.
+                if len(connections) == 1:
+                    raise smtplib.SMTPServerDisconnected("dropped during STARTTLS")
+
+            def login(self, username, password):
+                pass
+
+            def send_message(self, msg):
+                self.sent += 1
+
+            def quit(self):
+                pass
+
+            def close(self):
+                self.closed = True
+
+        monkeypatch.setattr(smtplib, "SMTP", FakeSMTP)
+        config.DEBUG = False
+        service = EmailService(config)
+        assert service.send_welcome_email("test@example.com", "jo", "Jo") is True
+        service.close()
+        assert len(connections) == 2
+        assert connections[0].closed is True
+        assert [c.sent for c in connections] == [0, 1]
+
+    def test_smtp_disconnect_before_greeting(self, config, monkeypatch):
+        class FakeSMTP:
+            def __init__(self, host, port):
+                raise smtplib.SMTPServerDisconnected("closed before greeting")
+
+        monkeypatch.setattr(smtplib, "SMTP", FakeSMTP)
+        config.DEBUG = False
+        service = EmailService(config)
+        assert service.send_welcome_email("test@example.com", "kim", "Kim") is False
+
 
 # ------------------------------------------------------------------ #
 # PaymentService tests